@@ -1,12 +1,20 @@
 # -*- coding: utf-8 -*-
 
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field, InitVar
+from functools import partial
 from pathlib import Path
+import sys
 
-from wireviz.wv_helper import int2tuple, aspect_ratio
+from wireviz.wv_helper import int2tuple, aspect_ratio, parse_number_and_unit
 from wireviz.wv_colors import Color, Colors, ColorMode, ColorScheme, COLOR_CODES
 
+# Harnesses may contain many component instances; generating __slots__ avoids a
+# per-instance __dict__, reducing memory usage and speeding up attribute access.
+# dataclass(slots=True) requires python 3.10; fall back to regular dataclasses below.
+if sys.version_info >= (3, 10):
+    dataclass = partial(dataclass, slots=True)
+
 
 # Each type alias have their legal values described in comments - validation might be implemented in the future
 PlainText = str # Text not containing HTML tags nor newlines
@@ -28,8 +36,7 @@ OneOrMoreWires = Union[Wire, Tuple[Wire, ...]] # One or a tuple of wires
 
 # Metadata can contain whatever is needed by the HTML generation/template.
 MetadataKeys = PlainText  # Literal['title', 'description', 'notes', ...]
-class Metadata(dict):
-    pass
+Metadata = dict  # Alias; a plain dict avoids the lookup overhead of an empty subclass
 
 
 @dataclass
@@ -110,10 +117,16 @@ class AdditionalComponent:
     unit: Optional[str] = None
     qty_multiplier: Union[ConnectorMultiplier, CableMultiplier, None] = None
     bgcolor: Optional[Color] = None
+    # Internal attributes, not set by the user:
+    _description: str = field(init=False, default='')
+
+    def __post_init__(self) -> None:
+        # Precompute once; BOM generation reads the description repeatedly per component.
+        self._description = self.type.rstrip() + (f', {self.subtype.rstrip()}' if self.subtype else '')
 
     @property
     def description(self) -> str:
-        return self.type.rstrip() + (f', {self.subtype.rstrip()}' if self.subtype else '')
+        return self._description
 
 
 @dataclass
@@ -133,27 +146,29 @@ class Connector:
     pincount: Optional[int] = None
     image: Optional[Image] = None
     notes: Optional[MultilineHypertext] = None
-    pins: List[Pin] = field(default_factory=list)
-    pinlabels: List[Pin] = field(default_factory=list)
-    pincolors: List[Color] = field(default_factory=list)
+    # Sequence fields default to the shared empty tuple; they are never mutated in
+    # place, so this avoids allocating empty lists for the many unused ones.
+    pins: List[Pin] = ()
+    pinlabels: List[Pin] = ()
+    pincolors: List[Color] = ()
     color: Optional[Color] = None
     show_name: Optional[bool] = None
     show_pincount: Optional[bool] = None
     hide_disconnected_pins: bool = False
     autogenerate: bool = False
-    loops: List[List[Pin]] = field(default_factory=list)
+    loops: List[List[Pin]] = ()
     ignore_in_bom: bool = False
-    additional_components: List[AdditionalComponent] = field(default_factory=list)
+    additional_components: List[AdditionalComponent] = ()
+    # Internal attributes, not set by the user:
+    ports_left: bool = field(init=False, default=False)
+    ports_right: bool = field(init=False, default=False)
+    visible_pins: Set[Pin] = field(init=False, default_factory=set)
 
     def __post_init__(self) -> None:
 
-        if isinstance(self.image, dict):
+        if type(self.image) is dict:  # exact check; YAML parsing only ever produces plain dicts
             self.image = Image(**self.image)
 
-        self.ports_left = False
-        self.ports_right = False
-        self.visible_pins = {}
-
         if self.style == 'simple':
             if self.pincount and self.pincount > 1:
                 raise Exception('Connectors with style set to simple may only have one pin')
@@ -184,12 +199,11 @@ class Connector:
             if len(loop) != 2:
                 raise Exception('Loops must be between exactly two pins!')
 
-        for i, item in enumerate(self.additional_components):
-            if isinstance(item, dict):
-                self.additional_components[i] = AdditionalComponent(**item)
+        self.additional_components = [AdditionalComponent(**item) if type(item) is dict else item
+                                      for item in self.additional_components]
 
     def activate_pin(self, pin: Pin) -> None:
-        self.visible_pins[pin] = True
+        self.visible_pins.add(pin)
 
     def get_qty_multiplier(self, qty_multiplier: Optional[ConnectorMultiplier]) -> int:
         if not qty_multiplier:
@@ -197,7 +211,7 @@ class Connector:
         elif qty_multiplier == 'pincount':
             return self.pincount
         elif qty_multiplier == 'populated':
-            return sum(self.visible_pins.values())
+            return len(self.visible_pins)
         else:
             raise ValueError(f'invalid qty multiplier parameter for connector {qty_multiplier}')
 
@@ -224,23 +238,26 @@ class Cable:
     shield: Union[bool, Color] = False
     image: Optional[Image] = None
     notes: Optional[MultilineHypertext] = None
-    colors: List[Colors] = field(default_factory=list)
-    wirelabels: List[Wire] = field(default_factory=list)
+    # Sequence fields default to the shared empty tuple (see Connector above)
+    colors: List[Colors] = ()
+    wirelabels: List[Wire] = ()
     color_code: Optional[ColorScheme] = None
     show_name: bool = True
     show_wirecount: bool = True
     show_wirenumbers: Optional[bool] = None
     ignore_in_bom: bool = False
-    additional_components: List[AdditionalComponent] = field(default_factory=list)
+    additional_components: List[AdditionalComponent] = ()
+    # Internal attributes, not set by the user:
+    connections: List['Connection'] = field(init=False, default_factory=list)
 
     def __post_init__(self) -> None:
 
-        if isinstance(self.image, dict):
+        if type(self.image) is dict:  # exact check; YAML parsing only ever produces plain dicts
             self.image = Image(**self.image)
 
         if isinstance(self.gauge, str):  # gauge and unit specified
             try:
-                g, u = self.gauge.split(' ')
+                g, u = parse_number_and_unit(self.gauge)
             except Exception:
                 raise Exception(f'Cable {self.name} gauge={self.gauge} - Gauge must be a number, or number and unit separated by a space')
             self.gauge = g
@@ -250,7 +267,7 @@ class Cable:
             if u.upper() == 'AWG':
                 self.gauge_unit = u.upper()
             else:
-                self.gauge_unit = u.replace('mm2', 'mm\u00B2')
+                self.gauge_unit = 'mm\u00B2' if u == 'mm2' else u
 
         elif self.gauge is not None:  # gauge specified, assume mm2
             if self.gauge_unit is None:
@@ -260,7 +277,7 @@ class Cable:
 
         if isinstance(self.length, str):  # length and unit specified
             try:
-                L, u = self.length.split(' ')
+                L, u = parse_number_and_unit(self.length)
                 L = float(L)
             except Exception:
                 raise Exception(f'Cable {self.name} length={self.length} - Length must be a number, or number and unit separated by a space')
@@ -268,13 +285,11 @@ class Cable:
             if self.length_unit is not None:
                 print(f'Warning: Cable {self.name} length_unit={self.length_unit} is ignored because its length contains {u}')
             self.length_unit = u
-        elif not any(isinstance(self.length, t) for t in [int, float]):
+        elif not isinstance(self.length, (int, float)):
             raise Exception(f'Cable {self.name} length has a non-numeric value')
         elif self.length_unit is None:
             self.length_unit = 'm'
 
-        self.connections = []
-
         if self.wirecount:  # number of wires explicitly defined
             if self.colors:  # use custom color palette (partly or looped if needed)
                 pass
@@ -285,12 +300,12 @@ class Cable:
             else:  # no colors defined, add dummy colors
                 self.colors = [''] * self.wirecount
 
-            # make color code loop around if more wires than colors
+            # make color code loop around if more wires than colors, and cut off excess;
+            # list multiplication and slicing both run in C, avoiding a per-wire loop
             if self.wirecount > len(self.colors):
-                m = self.wirecount // len(self.colors) + 1
-                self.colors = self.colors * int(m)
-            # cut off excess after looping
-            self.colors = self.colors[:self.wirecount]
+                self.colors = (self.colors * (self.wirecount // len(self.colors) + 1))[:self.wirecount]
+            else:
+                self.colors = self.colors[:self.wirecount]
         else:  # wirecount implicit in length of color list
             if not self.colors:
                 raise Exception('Unknown number of wires. Must specify wirecount or colors (implicit length)')
@@ -314,9 +329,8 @@ class Cable:
         if self.show_wirenumbers is None:
             self.show_wirenumbers = self.category != 'bundle'
 
-        for i, item in enumerate(self.additional_components):
-            if isinstance(item, dict):
-                self.additional_components[i] = AdditionalComponent(**item)
+        self.additional_components = [AdditionalComponent(**item) if type(item) is dict else item
+                                      for item in self.additional_components]
 
     # The *_pin arguments accept a tuple, but it seems not in use with the current code.
     def connect(self, from_name: Optional[Designator], from_pin: NoneOrMorePinIndices, via_wire: OneOrMoreWires,
@@ -344,8 +358,9 @@ class Cable:
             raise ValueError(f'invalid qty multiplier parameter for cable {qty_multiplier}')
 
 
-@dataclass
-class Connection:
+class Connection(NamedTuple):
+    # One record per wire termination; harnesses may contain thousands, and they
+    # never change once created, so flat tuple storage keeps them as small as possible.
     from_name: Optional[Designator]
     from_port: Optional[PinIndex]
     via_port: Wire
@@ -5,7 +5,6 @@ from collections import Counter
 from typing import Any, List, Union
 from dataclasses import dataclass
 from pathlib import Path
-from itertools import zip_longest
 import re
 
 from wireviz import wv_colors, __version__, APP_NAME, APP_URL
@@ -146,8 +145,17 @@ class Harness:
                 pinhtml = []
                 pinhtml.append('<table border="0" cellspacing="0" cellpadding="3" cellborder="1">')
 
-                for pinindex, (pinname, pinlabel, pincolor) in enumerate(zip_longest(connector.pins, connector.pinlabels, connector.pincolors)):
-                    if connector.hide_disconnected_pins and not connector.visible_pins.get(pinname, False):
+                # pad the pin information lists to equal length once and use plain zip;
+                # zip_longest would pay the sentinel-handling overhead on every pin
+                pins = list(connector.pins)
+                pinlabels = list(connector.pinlabels)
+                pincolors = list(connector.pincolors)
+                rowcount = max(len(pins), len(pinlabels), len(pincolors))
+                for pinlist in (pins, pinlabels, pincolors):
+                    pinlist.extend([None] * (rowcount - len(pinlist)))
+
+                for pinindex, (pinname, pinlabel, pincolor) in enumerate(zip(pins, pinlabels, pincolors)):
+                    if connector.hide_disconnected_pins and pinname not in connector.visible_pins:
                         continue
                     pinhtml.append('   <tr>')
                     if connector.ports_left:
@@ -239,7 +247,23 @@ class Harness:
             wirehtml.append('<table border="0" cellspacing="0" cellborder="0">')  # conductor table
             wirehtml.append('   <tr><td>&nbsp;</td></tr>')
 
-            for i, (connection_color, wirelabel) in enumerate(zip_longest(cable.colors, cable.wirelabels), 1):
+            # pad the wire information lists to equal length once and use plain zip (see pins above)
+            colors = list(cable.colors)
+            wirelabels = list(cable.wirelabels)
+            rowcount = max(len(colors), len(wirelabels))
+            for wirelist in (colors, wirelabels):
+                wirelist.extend([None] * (rowcount - len(wirelist)))
+
+            if cable.category == 'bundle':
+                # for bundles individual wires can have part information;
+                # check which part data fields are per-wire lists once, not once per wire
+                wire_pns = cable.pn if isinstance(cable.pn, list) else None
+                wire_manufacturers = cable.manufacturer if isinstance(cable.manufacturer, list) else None
+                wire_mpns = cable.mpn if isinstance(cable.mpn, list) else None
+                wire_suppliers = cable.supplier if isinstance(cable.supplier, list) else None
+                wire_spns = cable.spn if isinstance(cable.spn, list) else None
+
+            for i, (connection_color, wirelabel) in enumerate(zip(colors, wirelabels), 1):
                 wirehtml.append('   <tr>')
                 wirehtml.append(f'    <td><!-- {i}_in --></td>')
                 wirehtml.append(f'    <td>')
@@ -267,17 +291,17 @@ class Harness:
                 wirehtml.append('     </table>')
                 wirehtml.append('    </td>')
                 wirehtml.append('   </tr>')
-                if cable.category == 'bundle':  # for bundles individual wires can have part information
+                if cable.category == 'bundle':
                     # create a list of wire parameters
                     wireidentification = []
-                    if isinstance(cable.pn, list):
-                        wireidentification.append(pn_info_string(HEADER_PN, None, remove_links(cable.pn[i - 1])))
+                    if wire_pns is not None:
+                        wireidentification.append(pn_info_string(HEADER_PN, None, remove_links(wire_pns[i - 1])))
                     manufacturer_info = pn_info_string(HEADER_MPN,
-                        cable.manufacturer[i - 1] if isinstance(cable.manufacturer, list) else None,
-                        cable.mpn[i - 1] if isinstance(cable.mpn, list) else None)
+                        wire_manufacturers[i - 1] if wire_manufacturers is not None else None,
+                        wire_mpns[i - 1] if wire_mpns is not None else None)
                     supplier_info = pn_info_string(HEADER_SPN,
-                        cable.supplier[i - 1] if isinstance(cable.supplier, list) else None,
-                        cable.spn[i - 1] if isinstance(cable.spn, list) else None)
+                        wire_suppliers[i - 1] if wire_suppliers is not None else None,
+                        wire_spns[i - 1] if wire_spns is not None else None)
                     if manufacturer_info:
                         wireidentification.append(html_line_breaks(manufacturer_info))
                     if supplier_info:
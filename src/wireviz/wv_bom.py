@@ -124,7 +124,8 @@ def generate_bom(harness: "Harness") -> List[BOMEntry]:
     bom = []
     for _, group in groupby(sorted(bom_entries, key=bom_entry_key), key=bom_entry_key):
         group_entries = list(group)
-        designators = sum((make_list(entry.get('designators')) for entry in group_entries), [])
+        # flatten with a comprehension; sum(..., []) would build a new list per entry
+        designators = [d for entry in group_entries for d in make_list(entry.get('designators'))]
         total_qty = sum(entry.get('qty', 1) for entry in group_entries)
         bom.append({**group_entries[0], 'qty': round(total_qty, 3), 'designators': sorted(set(designators))})
 
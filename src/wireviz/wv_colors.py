@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 COLOR_CODES = {
     'DIN': ['WH', 'BN', 'GN', 'YE', 'GY', 'PK', 'BU', 'RD', 'BK', 'VT', 'GYPK', 'RDBU', 'WHGN', 'BNGN', 'WHYE', 'YEBN',
@@ -118,6 +119,14 @@ ColorScheme = str  # Color scheme name = Literal[COLOR_CODES.keys()]
 
 def get_color_hex(input: Colors, pad: bool = False) -> List[str]:
     """Return list of hex colors from either a string of color names or :-separated hex colors."""
+    return list(_get_color_hex(input, pad))
+
+
+# Parsing a color description is expensive, and the same few color strings recur
+# once per wire and per connection; cache the results keyed on the input string.
+# The cache holds immutable tuples so that callers cannot mutate cached entries.
+@lru_cache(maxsize=None)
+def _get_color_hex(input: Colors, pad: bool = False) -> Tuple[str, ...]:
     if input is None or input == '':
         return [color_default]
     elif input[0] == '#':  # Hex color(s)
@@ -145,7 +154,7 @@ def get_color_hex(input: Colors, pad: bool = False) -> List[str]:
     elif pad and len(output) == 1:  # Hacky style fix: Give single color wires
         output *= 3                 # a triple-up so that wires are the same size.
 
-    return output
+    return tuple(output)
 
 
 def get_color_translation(translate: Dict[Color, str], input: Colors) -> List[str]:
@@ -160,6 +169,7 @@ def get_color_translation(translate: Dict[Color, str], input: Colors) -> List[st
            [translate.get(input[i:i+2], '??') for i in range(0, len(input), 2)]
 
 
+@lru_cache(maxsize=None)
 def translate_color(input: Colors, color_mode: ColorMode) -> str:
     if input == '' or input is None:
         return ''
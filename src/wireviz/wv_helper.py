@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from functools import lru_cache
 from typing import List
 import re
 
@@ -65,6 +66,13 @@ def expand(yaml_data):
     return output
 
 
+def parse_number_and_unit(inp):
+    # Split a 'number unit' string into its two parts.
+    # Raises ValueError unless exactly one space separates the two.
+    number, unit = inp.split(' ')
+    return number, unit
+
+
 def int2tuple(inp):
     if isinstance(inp, tuple):
         output = inp
@@ -83,12 +91,16 @@ def tuplelist2tsv(inp, header=None):
         inp.insert(0, header)
     inp = flatten2d(inp)
     for row in inp:
-        output = output + '\t'.join(str(remove_links(item)) for item in row) + '\n'
+        # flatten2d() has already converted every item to str; no need to re-wrap
+        output = output + '\t'.join(remove_links(item) for item in row) + '\n'
     return output
 
 
+# Precompiled once; remove_links() runs for every cell of every BOM row and node table.
+_link_pattern = re.compile(r'<[aA] [^>]*>([^<]*)</[aA]>')
+
 def remove_links(inp):
-    return re.sub(r'<[aA] [^>]*>([^<]*)</[aA]>', r'\1', inp) if isinstance(inp, str) else inp
+    return _link_pattern.sub(r'\1', inp) if isinstance(inp, str) else inp
 
 
 def clean_whitespace(inp):
@@ -105,6 +117,9 @@ def open_file_write(filename):
 def open_file_append(filename):
     return open(filename, 'a', encoding='UTF-8')
 
+# Many components may reference the same image file; cache the result to avoid
+# re-opening the file for every Image object created during one program run.
+@lru_cache(maxsize=None)
 def aspect_ratio(image_src):
     try:
         from PIL import Image